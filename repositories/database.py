@@ -1,12 +1,47 @@
-from typing import Optional
-from sqlalchemy import create_engine, String, Integer, Float, Boolean
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+from dataclasses import replace
+from typing import Optional, Dict, Any, Callable, List, Set, Tuple
+from sqlalchemy import create_engine, event, select, update, cast, bindparam, String, Integer, Float, Boolean
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker, scoped_session, Session
 
 # Connection string points to an existing database; no automatic creation here
 DB_URL = "sqlite:///data/credit.db"
 
-engine = create_engine(DB_URL, echo=False, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+# Keep connections pooled across requests instead of reopening per handler.
+# QueuePool (one connection per concurrent thread; SQLAlchemy sets check_same_thread=False
+# for file DBs) rather than StaticPool, which would share a single sqlite3 connection
+# and its transaction across gunicorn threads. A local file connection never goes
+# stale, so no pre-ping round-trip on checkout and no recycling.
+engine = create_engine(
+    DB_URL,
+    echo=False,
+    future=True,
+    pool_size=10,
+    max_overflow=20,
+)
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_conn, _record):
+    """Per-connection SQLite tuning.
+
+    WAL lets readers run alongside the single writer and, with synchronous=NORMAL,
+    commits no longer fsync the main DB file every time (only at checkpoints).
+    """
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+    # Reads go through a shared memory map instead of read() into each connection's cache
+    cur.execute("PRAGMA mmap_size=268435456")  # up to 256 MB
+    cur.close()
+
+
+# One session per request/thread; the app removes it on teardown
+SessionLocal = scoped_session(
+    sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+)
 
 
 class Base(DeclarativeBase):
@@ -15,6 +50,8 @@ class Base(DeclarativeBase):
 
 class CreditProfileORM(Base):
     __tablename__ = "credit_profiles"
+    # Clustered on the string PK: a lookup is one b-tree descent, no rowid indirection
+    __table_args__ = {"sqlite_with_rowid": False}
 
     user_id: Mapped[str] = mapped_column(String, primary_key=True)
 
@@ -48,50 +85,136 @@ class CreditProfileORM(Base):
 
 # Do NOT auto-create tables; assume schema already exists
 
-# Conversion helpers live here to avoid circular deps
-from services.scoring import CreditProfile  # noqa: E402
-
-
-def orm_to_dc(orm: CreditProfileORM) -> CreditProfile:
-    return CreditProfile(
-        late_30=orm.late_30,
-        late_60=orm.late_60,
-        late_90p=orm.late_90p,
-        has_collection=orm.has_collection,
-        has_bankruptcy=orm.has_bankruptcy,
-        months_since_last_delinquency=orm.months_since_last_delinquency,
-        revolving_utilization=orm.revolving_utilization,
-        installment_balance_ratio=orm.installment_balance_ratio,
-        total_accounts=orm.total_accounts,
-        age_oldest_acct_years=orm.age_oldest_acct_years,
-        avg_age_years=orm.avg_age_years,
-        hard_inquiries_12m=orm.hard_inquiries_12m,
-        new_accounts_12m=orm.new_accounts_12m,
-        has_mortgage=orm.has_mortgage,
-        has_installment=orm.has_installment,
-        has_revolving=orm.has_revolving,
-        has_student_or_auto=orm.has_student_or_auto,
-    )
-
-
-def dc_to_orm(user_id: str, dc: CreditProfile, obj: Optional[CreditProfileORM] = None) -> CreditProfileORM:
-    if obj is None:
-        obj = CreditProfileORM(user_id=user_id)
-    obj.late_30 = dc.late_30
-    obj.late_60 = dc.late_60
-    obj.late_90p = dc.late_90p
-    obj.has_collection = dc.has_collection
-    obj.has_bankruptcy = dc.has_bankruptcy
-    obj.months_since_last_delinquency = dc.months_since_last_delinquency
-    obj.revolving_utilization = dc.revolving_utilization
-    obj.installment_balance_ratio = dc.installment_balance_ratio
-    obj.total_accounts = dc.total_accounts
-    obj.age_oldest_acct_years = dc.age_oldest_acct_years
-    obj.avg_age_years = dc.avg_age_years
-    obj.hard_inquiries_12m = dc.hard_inquiries_12m
-    obj.new_accounts_12m = dc.new_accounts_12m
-    obj.has_mortgage = dc.has_mortgage
-    obj.has_installment = dc.has_installment
-    obj.has_revolving = dc.has_revolving
-    obj.has_student_or_auto = dc.has_student_or_auto
-    return obj
+# Imported here (not at the top) to avoid circular deps
+from services.scoring import CreditProfile, profile_to_dict  # noqa: E402
+
+
+# ---- Statement-level upsert (no ORM read-modify-write) ----
+# RETURNING yields whole REALs as SQLite stores them (12.0 -> 12); cast keeps floats floats
+_PROFILE_COLUMNS = tuple(
+    cast(c, Float).label(c.key) if isinstance(c.type, Float) else c
+    for c in CreditProfileORM.__table__.c
+    if c.key != "user_id"
+)
+_SELECT_PROFILE = select(*_PROFILE_COLUMNS).where(
+    CreditProfileORM.__table__.c.user_id == bindparam("uid")
+)
+
+
+def fetch_profile(user_id: str) -> Optional[CreditProfile]:
+    """Read-only lookup through a plain Core connection (no Session / ORM hydration)."""
+    with engine.connect() as conn:
+        row = conn.execute(_SELECT_PROFILE, {"uid": user_id}).mappings().first()
+    return CreditProfile(**row) if row is not None else None
+
+
+def fetch_profiles(s: Session, user_ids: Optional[List[str]] = None) -> Dict[str, CreditProfile]:
+    """Bulk read as Core row tuples → CreditProfile (no ORM objects); all rows when `user_ids` is None."""
+    uid_col = CreditProfileORM.__table__.c.user_id
+    stmt = select(uid_col, *_PROFILE_COLUMNS)
+    if user_ids is not None:
+        stmt = stmt.where(uid_col.in_(user_ids))
+    return {row[0]: CreditProfile(*row[1:]) for row in s.execute(stmt)}
+
+
+def upsert_profile(
+    user_id: str,
+    overrides: Dict[str, Any],
+    default: CreditProfile,
+) -> Tuple[CreditProfile, bool]:
+    """Apply `overrides` to a stored profile, creating it from `default` if missing.
+
+    Runs in its own Core transaction (engine.begin(): commit on exit, no Session):
+    - Existing row: one UPDATE ... RETURNING (or a plain SELECT when nothing changes).
+    - Missing row: INSERT ... ON CONFLICT DO UPDATE, so a concurrent insert still merges.
+    Returns (profile, created). Build `default` before calling so no generation
+    work runs inside the transaction.
+    """
+    table = CreditProfileORM.__table__
+    if overrides:
+        stmt = (
+            update(table)
+            .where(table.c.user_id == user_id)
+            .values(**overrides)
+            .returning(*_PROFILE_COLUMNS)
+        )
+    else:
+        stmt = _SELECT_PROFILE.params(uid=user_id)
+    with engine.begin() as conn:
+        row = conn.execute(stmt).mappings().first()
+        if row is not None:
+            return CreditProfile(**row), False
+
+        dc = replace(default, **overrides) if overrides else default
+        ins = sqlite_insert(table).values(user_id=user_id, **profile_to_dict(dc))
+        if overrides:
+            ins = ins.on_conflict_do_update(
+                index_elements=[table.c.user_id],
+                set_={k: ins.excluded[k] for k in overrides},
+            )
+        else:
+            ins = ins.on_conflict_do_nothing(index_elements=[table.c.user_id])
+        row = conn.execute(ins.returning(*_PROFILE_COLUMNS)).mappings().first()
+        if row is None:
+            # Lost an insert race with nothing to apply: the other writer's row wins
+            row = conn.execute(_SELECT_PROFILE, {"uid": user_id}).mappings().one()
+            return CreditProfile(**row), False
+    return CreditProfile(**row), True
+
+
+def load_or_create_profiles(
+    s: Session,
+    user_ids: List[str],
+    make_default: Callable[[str], CreditProfile],
+) -> Tuple[Dict[str, CreditProfile], Set[str]]:
+    """Fetch many profiles with one SELECT ... IN and insert the missing ones in one executemany.
+
+    Returns ({user_id: profile}, ids_created). The caller owns the commit.
+    """
+    profiles = fetch_profiles(s, user_ids)
+
+    missing = [uid for uid in user_ids if uid not in profiles]
+    if missing:
+        dummies = {uid: make_default(uid) for uid in missing}
+        # ON CONFLICT DO NOTHING: a concurrent request creating the same user is not an error
+        s.execute(
+            sqlite_insert(CreditProfileORM.__table__).on_conflict_do_nothing(index_elements=["user_id"]),
+            [dict(profile_to_dict(dc), user_id=uid) for uid, dc in dummies.items()],
+        )
+        profiles.update(dummies)
+    return profiles, set(missing)
+
+
+def migrate_without_rowid() -> bool:
+    """Rebuild an existing rowid `credit_profiles` table as WITHOUT ROWID (one-off, idempotent).
+
+    Also switches the file to incremental auto-vacuum, which SQLite only applies
+    on a VACUUM. Returns True if the table was rebuilt.
+    """
+    table = CreditProfileORM.__table__
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        ddl = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table.name,)
+        ).scalar()
+        if ddl is None or "WITHOUT ROWID" in ddl.upper():
+            return False
+        old = f"{table.name}_rowid_old"
+        cols = ", ".join(c.name for c in table.c)
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            conn.exec_driver_sql(f"ALTER TABLE {table.name} RENAME TO {old}")
+            table.create(conn)
+            conn.exec_driver_sql(f"INSERT INTO {table.name} ({cols}) SELECT {cols} FROM {old}")
+            conn.exec_driver_sql(f"DROP TABLE {old}")
+            conn.exec_driver_sql("COMMIT")
+        except Exception:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+        conn.exec_driver_sql("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.exec_driver_sql("VACUUM")
+    return True
+
+
+if __name__ == "__main__":
+    # python -m repositories.database
+    print("migrated" if migrate_without_rowid() else "nothing to do")
@@ -0,0 +1,61 @@
+"""
+Small in-process caches shared by the API layer and services.
+
+Kept dependency-free on purpose: entries live in a plain insertion-ordered
+dict guarded by a lock, which is enough for the handful of hot lookups
+this service needs (JWT claims, scores, LLM responses).
+"""
+
+from __future__ import annotations
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded cache whose entries expire after a time-to-live (seconds).
+
+    - `ttl` is the default lifetime; `set(..., ttl=...)` may shorten it per entry.
+    - When `maxsize` is reached the oldest inserted entry is evicted.
+    - Safe to share between threads (threaded dev server / gunicorn threads).
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                # dicts keep insertion order → first key is the oldest entry
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + ttl, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
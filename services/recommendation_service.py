@@ -10,15 +10,22 @@ Final decision is determined by majority vote (2 out of 3).
 """
 
 from __future__ import annotations
-import json
+import functools
 import os
+import random
 import re
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple, List
-from collections import Counter
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, List
 
+import orjson
 from dotenv import load_dotenv, find_dotenv
 from google import genai
+from google.genai import errors as genai_errors
+from google.genai import types as genai_types
+
+from services.cache import TTLCache
 
 # Load environment variables
 load_dotenv(find_dotenv(), override=True)
@@ -46,8 +53,36 @@ DEFAULT_MIN_SCORE = float(_clean_env(os.getenv("MIN_SCORE", "700")) or 700)
 DEFAULT_MAX_DTI = float(_clean_env(os.getenv("MAX_DTI", "0.45")) or 0.45)
 DEFAULT_MAX_LTV = float(_clean_env(os.getenv("MAX_LTV", "0.9")) or 0.9)
 
+# Successful Gemini answers keyed by (model, temperature, max_tokens, prompt); an identical
+# application skips the multi-second round trip. Per process; LLM_CACHE_TTL=0 disables it.
+LLM_CACHE_TTL = float(_clean_env(os.getenv("LLM_CACHE_TTL", "86400")) or 0)
+_LLM_CACHE = TTLCache(maxsize=1024, ttl=LLM_CACHE_TTL)
+
+# Hedged fallback (opt-in): if a model has not answered after LLM_HEDGE_DELAY seconds, the
+# next model is started alongside it and the first usable answer wins. Each hedge is an
+# extra billed request, and the losing call still runs to completion on _LLM_POOL, holding
+# a worker thread and quota. 0 (default) = strictly sequential, no pool used.
+LLM_HEDGE_DELAY = float(_clean_env(os.getenv("LLM_HEDGE_DELAY", "0")) or 0)
+_LLM_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="gemini")
+
+# Per-request HTTP timeout (seconds) for Gemini calls; a hung model then counts as a
+# failure and the next fallback starts instead of blocking the request. 0 = SDK default.
+LLM_TIMEOUT = float(_clean_env(os.getenv("LLM_TIMEOUT", "30")) or 0)
+
+# When rules and gate agree the LLM cannot change the 2-of-3 majority, so it is skipped;
+# ALWAYS_LLM=1 still asks it (audit/QA runs that want the narrative and a 3-vote tally).
+ALWAYS_LLM = (_clean_env(os.getenv("ALWAYS_LLM", "0")) or "0").lower() in ("1", "true", "yes")
+
+# Transient API errors (rate limit / overloaded / timeout) are retried on the same model
+# with capped exponential backoff + jitter; anything else goes straight to the fallback.
+LLM_MAX_RETRIES = int(_clean_env(os.getenv("LLM_MAX_RETRIES", "2")) or 0)
+LLM_RETRY_BASE = float(_clean_env(os.getenv("LLM_RETRY_BASE", "1")) or 1)
+LLM_RETRY_CAP = float(_clean_env(os.getenv("LLM_RETRY_CAP", "8")) or 8)
+_RETRYABLE_CODES = frozenset({408, 429, 500, 502, 503, 504})
+_STRICT_JSON_SUFFIX = "\n\nPENTING: balas HANYA dengan satu objek JSON valid sesuai skema, tanpa teks lain."
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Derived:
     """Derived metrics from application data."""
     dti: Optional[float]  # Debt-to-Income ratio
@@ -55,7 +90,7 @@ class Derived:
     score: Optional[float]  # Credit score
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuleConfig:
     """Configuration for rule-based evaluation."""
     min_score: float = DEFAULT_MIN_SCORE
@@ -113,12 +148,16 @@ def pct(x: Optional[float]) -> str:
     return f"{x*100:.0f}%" if (x is not None) else "—"
 
 
+_THOUSANDS_TO_DOT = str.maketrans(",", ".")
+
+
 def fmt_money(x: Optional[float]) -> str:
     """Format money in Indonesian rupiah."""
     if x is None:
         return "—"
     try:
-        return f"Rp{x:,.0f}".replace(",", ".")
+        # Group with "," (rounding like before), then swap to "." in one C-level pass
+        return "Rp" + format(x, ",.0f").translate(_THOUSANDS_TO_DOT)
     except Exception:
         return str(x)
 
@@ -171,6 +210,9 @@ def human_reasons(decision: str, rules_reason: List[str], gate_reason: List[str]
     return reasons[:6]
 
 
+_WS_RE = re.compile(r"\s+")
+
+
 def build_summary_paragraph(decision: str, d: Derived,
                             max_dti: float, max_ltv: float, min_score: float,
                             llm_notes: str = "") -> str:
@@ -190,7 +232,7 @@ def build_summary_paragraph(decision: str, d: Derived,
 
     note = (llm_notes or "").strip()
     if note:
-        note = re.sub(r"\s+", " ", note)
+        note = _WS_RE.sub(" ", note)
         if len(note) > 350:
             note = note[:347] + "..."
         base += " " + note
@@ -199,27 +241,52 @@ def build_summary_paragraph(decision: str, d: Derived,
     return base
 
 
-def rules_decide(profile: Dict[str, Any], fico: Dict[str, Any], cfg: RuleConfig) -> Dict[str, Any]:
+# (metric, breached(value, cfg), reason(value, cfg)); checked and reported in this order.
+# A metric that could not be derived (None) never breaches.
+_Rule = Tuple[str, Callable[[float, RuleConfig], bool], Callable[[float, RuleConfig], str]]
+
+_RULES: Tuple[_Rule, ...] = (
+    ("score", lambda v, c: v < c.min_score,
+     lambda v, c: f"Skor kredit sekitar {int(v)} berada di bawah kisaran acuan {int(c.min_score)}."),
+    ("dti", lambda v, c: v > c.max_dti,
+     lambda v, c: f"Rasio cicilan terhadap penghasilan (DTI) {pct(v)} melebihi batas {int(c.max_dti*100)}%."),
+    ("ltv", lambda v, c: v > c.max_ltv,
+     lambda v, c: f"Rasio pinjaman terhadap nilai properti (LTV) {pct(v)} melebihi batas {int(c.max_ltv*100)}%."),
+)
+
+# Hard limits: the rule thresholds plus a margin
+_GATE_RULES: Tuple[_Rule, ...] = (
+    ("dti", lambda v, c: v > (c.max_dti + 0.10),
+     lambda v, c: f"DTI {pct(v)} cukup jauh di atas batas {int(c.max_dti*100)}%."),
+    ("ltv", lambda v, c: v > (c.max_ltv + 0.05),
+     lambda v, c: f"LTV {pct(v)} melampaui batas {int(c.max_ltv*100)}% dengan margin yang signifikan."),
+    ("score", lambda v, c: v < (c.min_score - 50),
+     lambda v, c: f"Skor {int(v)} berada jauh di bawah kisaran yang diharapkan."),
+)
+
+
+def _violations(rules: Tuple[_Rule, ...], d: Derived, cfg: RuleConfig) -> List[str]:
+    """Reasons for every rule in `rules` that `d` breaches (empty list = all passed)."""
+    reasons: List[str] = []
+    for metric, breached, reason in rules:
+        v = getattr(d, metric)
+        if v is not None and breached(v, cfg):
+            reasons.append(reason(v, cfg))
+    return reasons
+
+
+def rules_decide(profile: Dict[str, Any], fico: Dict[str, Any], cfg: RuleConfig,
+                 d: Optional[Derived] = None) -> Dict[str, Any]:
     """
     Rules-based evaluation using DTI, LTV, and credit score thresholds.
     
+    Pass `d` when the metrics are already derived to skip recomputing them.
     Returns decision dict with APPROVE/REJECT and reasons.
     """
-    d = derive_metrics(profile, fico)
-    approve = True
-    reasons: List[str] = []
-
-    if d.score is not None and d.score < cfg.min_score:
-        approve = False
-        reasons.append(f"Skor kredit sekitar {int(d.score)} berada di bawah kisaran acuan {int(cfg.min_score)}.")
-        
-    if d.dti is not None and d.dti > cfg.max_dti:
-        approve = False
-        reasons.append(f"Rasio cicilan terhadap penghasilan (DTI) {pct(d.dti)} melebihi batas {int(cfg.max_dti*100)}%.")
-        
-    if d.ltv is not None and d.ltv > cfg.max_ltv:
-        approve = False
-        reasons.append(f"Rasio pinjaman terhadap nilai properti (LTV) {pct(d.ltv)} melebihi batas {int(cfg.max_ltv*100)}%.")
+    if d is None:
+        d = derive_metrics(profile, fico)
+    reasons = _violations(_RULES, d, cfg)
+    approve = not reasons
 
     decision = "APPROVE" if approve else "REJECT"
     confidence = 0.75 if approve else 0.8
@@ -233,27 +300,18 @@ def rules_decide(profile: Dict[str, Any], fico: Dict[str, Any], cfg: RuleConfig)
     }
 
 
-def gate_decide(profile: Dict[str, Any], fico: Dict[str, Any], cfg: RuleConfig) -> Dict[str, Any]:
+def gate_decide(profile: Dict[str, Any], fico: Dict[str, Any], cfg: RuleConfig,
+                d: Optional[Derived] = None) -> Dict[str, Any]:
     """
     Gate evaluation for hard limits (severe violations).
     
+    Pass `d` when the metrics are already derived to skip recomputing them.
     Returns decision dict with APPROVE/REJECT and reasons.
     """
-    d = derive_metrics(profile, fico)
-    reasons: List[str] = []
-    hard_fail = False
-
-    if d.dti is not None and d.dti > (cfg.max_dti + 0.10):
-        hard_fail = True
-        reasons.append(f"DTI {pct(d.dti)} cukup jauh di atas batas {int(cfg.max_dti*100)}%.")
-        
-    if d.ltv is not None and d.ltv > (cfg.max_ltv + 0.05):
-        hard_fail = True
-        reasons.append(f"LTV {pct(d.ltv)} melampaui batas {int(cfg.max_ltv*100)}% dengan margin yang signifikan.")
-        
-    if d.score is not None and d.score < (cfg.min_score - 50):
-        hard_fail = True
-        reasons.append(f"Skor {int(d.score)} berada jauh di bawah kisaran yang diharapkan.")
+    if d is None:
+        d = derive_metrics(profile, fico)
+    reasons = _violations(_GATE_RULES, d, cfg)
+    hard_fail = bool(reasons)
 
     if hard_fail:
         decision, confidence = "REJECT", 0.9
@@ -293,92 +351,237 @@ def extract_text(resp) -> str:
     return "\n".join(texts).strip()
 
 
+# Only these characters change the scanner's state; everything else is skipped in C
+_JSON_SCAN_TOKENS = re.compile(r'[{}"\\]')
+
+
+def _iter_json_objects(text: str):
+    """Yield each top-level balanced `{...}` span in one left-to-right pass.
+
+    Tracks string/escape state, so braces inside JSON strings do not count.
+    """
+    depth, start, in_str, skip = 0, -1, False, -1
+    for m in _JSON_SCAN_TOKENS.finditer(text):
+        i = m.start()
+        if i < skip:
+            continue
+        ch = text[i]
+        if in_str:
+            if ch == "\\":
+                skip = i + 2  # escaped char can't close the string
+            elif ch == '"':
+                in_str = False
+        elif ch == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == "}":
+            if depth:
+                depth -= 1
+                if depth == 0:
+                    yield text[start:i + 1]
+        elif ch == '"' and depth:
+            in_str = True
+
+
 def extract_json(text: str) -> Optional[Dict[str, Any]]:
-    """Extract JSON from text (handles code blocks and raw JSON)."""
+    """Extract JSON from text (handles code blocks and raw JSON).
+
+    With response_mime_type=application/json the whole reply is normally the object,
+    so parse it directly; otherwise take the first balanced object that parses.
+    """
     if not text:
         return None
-    for pat in (r"```json\s*(\{.*?\})\s*```", r"```\s*(\{.*?\})\s*```"):
-        blocks = re.findall(pat, text, flags=re.DOTALL)
-        for b in blocks:
-            try:
-                return json.loads(b)
-            except Exception:
-                pass
-    fb, lb = text.find("{"), text.rfind("}")
-    if fb != -1 and lb != -1 and lb > fb:
-        frag = text[fb:lb+1]
+    try:
+        obj = orjson.loads(text)
+        if isinstance(obj, dict):
+            return obj
+    except Exception:
+        pass
+    for frag in _iter_json_objects(text):
         try:
-            return json.loads(frag)
+            obj = orjson.loads(frag)
         except Exception:
-            pass
+            continue
+        if isinstance(obj, dict):
+            return obj
     return None
 
 
-def build_llm_prompt(profile: Dict[str, Any], fico: Dict[str, Any], d: Derived) -> str:
-    """Build prompt for LLM evaluation."""
-    schema = {
-        "type": "object",
-        "properties": {
-            "decision": {"type": "string", "enum": ["APPROVE", "REJECT"]},
-            "confidence": {"type": "number", "minimum": 0, "maximum": 1},
-            "reasons": {"type": "array", "items": {"type": "string"}},
-            "key_factors": {"type": "object", "additionalProperties": True},
-            "conditions": {"type": "array", "items": {"type": "string"}},
-            "notes": {"type": "string"}
-        },
-        "required": ["decision", "confidence", "reasons"]
-    }
-    guidance = """
+# Canonical (sorted), compact UTF-8 JSON for the prompt payloads
+_PROMPT_JSON_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+_LLM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "decision": {"type": "string", "enum": ["APPROVE", "REJECT"]},
+        "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+        "reasons": {"type": "array", "items": {"type": "string"}},
+        "key_factors": {"type": "object", "additionalProperties": True},
+        "conditions": {"type": "array", "items": {"type": "string"}},
+        "notes": {"type": "string"}
+    },
+    "required": ["decision", "confidence", "reasons"]
+}
+_LLM_GUIDANCE = """
 Gunakan bahasa Indonesia yang komunikatif dan diplomatis. Keputusan hanya "APPROVE" atau "REJECT".
 Jika menyebut angka (DTI/LTV/skor), jelaskan maknanya secara ringkas.
 """
-    return f"""
-Anda adalah underwriter senior KPR.
+# Static parts of the prompt, rendered once; only the metrics and the two JSON payloads vary
+_PROMPT_HEAD = f"""Anda adalah underwriter senior KPR.
 Evaluasi pengajuan berikut dari 2 JSON di bawah ini.
 Keluarkan **HANYA** JSON sesuai skema (tanpa teks lain):
-{json.dumps(schema, ensure_ascii=False)}
+{orjson.dumps(_LLM_SCHEMA).decode()}
 
 Nilai bantu:
-- dti={d.dti if d.dti is not None else "null"}
-- ltv={d.ltv if d.ltv is not None else "null"}
-- fico_score={d.score if d.score is not None else "null"}
+"""
+_PROMPT_GUIDANCE_BLOCK = f"\n\n{_LLM_GUIDANCE}\n\n[PROFILE_JSON]\n"
 
-{guidance}
 
-[PROFILE_JSON]
-{json.dumps(profile, ensure_ascii=False)}
+def build_llm_prompt(profile: Dict[str, Any], fico: Dict[str, Any], d: Derived) -> str:
+    """Build prompt for LLM evaluation.
 
-[FICO_JSON]
-{json.dumps(fico, ensure_ascii=False)}
-""".strip()
+    Inputs are serialized with sorted keys, so the same application always yields the
+    same prompt (and hits `_LLM_CACHE`) regardless of the client's key order.
+    """
+    return "".join((
+        _PROMPT_HEAD,
+        f"- dti={d.dti if d.dti is not None else 'null'}\n",
+        f"- ltv={d.ltv if d.ltv is not None else 'null'}\n",
+        f"- fico_score={d.score if d.score is not None else 'null'}",
+        _PROMPT_GUIDANCE_BLOCK,
+        orjson.dumps(profile, option=_PROMPT_JSON_OPTS).decode(),
+        "\n\n[FICO_JSON]\n",
+        orjson.dumps(fico, option=_PROMPT_JSON_OPTS).decode(),
+    ))
+
+
+@functools.lru_cache(maxsize=1)
+def _client() -> genai.Client:
+    """One client per process: keeps its HTTP connection pool (TLS keep-alive) across calls."""
+    http_options = genai_types.HttpOptions(timeout=int(LLM_TIMEOUT * 1000)) if LLM_TIMEOUT > 0 else None
+    return genai.Client(api_key=API_KEY, http_options=http_options)
+
+
+def _stream_until_decision(client: genai.Client, model: str, contents: str, config: Dict[str, Any]) -> str:
+    """Stream a reply and stop reading once it holds a complete JSON object with a decision.
+
+    Anything the model would still generate after that object (trailing tokens,
+    a second block) is not waited for; closing the stream drops the connection.
+    """
+    parts: List[str] = []
+    stream = client.models.generate_content_stream(model=model, contents=contents, config=config)
+    try:
+        for chunk in stream:
+            t = extract_text(chunk)
+            if not t:
+                continue
+            parts.append(t)
+            if "}" in t:
+                obj = extract_json("".join(parts))
+                if obj is not None and "decision" in obj:
+                    break
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+    return "".join(parts)
 
 
 def call_gemini(prompt: str, model: str, temperature: float, max_tokens: int) -> Tuple[Optional[Dict[str, Any]], Optional[str], str]:
-    """Call Gemini API with retry logic."""
+    """Call Gemini API; successful parses are served from `_LLM_CACHE` on repeat."""
     if not API_KEY:
         return None, "GEMINI_API_KEY not configured", ""
-        
-    client = genai.Client(api_key=API_KEY)
-    try:
-        resp = client.models.generate_content(
-            model=model,
-            contents=prompt,
-            config={
-                "temperature": temperature,
-                "max_output_tokens": max_tokens,
-                "response_mime_type": "application/json",
-            },
-        )
-        raw = extract_text(resp)
+
+    key = (model, temperature, max_tokens, prompt)
+    hit = _LLM_CACHE.get(key)
+    if hit is not None:
+        blob, raw = hit
+        return orjson.loads(blob), None, raw  # fresh objects: callers may mutate them
+
+    client = _client()
+    contents = prompt
+    json_retried = False
+    attempt = 0
+    while True:
+        try:
+            raw = _stream_until_decision(
+                client,
+                model,
+                contents,
+                {
+                    "temperature": temperature,
+                    "max_output_tokens": max_tokens,
+                    "response_mime_type": "application/json",
+                },
+            )
+        except genai_errors.APIError as e:
+            if e.code in _RETRYABLE_CODES and attempt < LLM_MAX_RETRIES:
+                time.sleep(min(LLM_RETRY_CAP, LLM_RETRY_BASE * 2 ** attempt) + random.uniform(0, 0.5))
+                attempt += 1
+                continue
+            return None, str(e), ""
+        except Exception as e:
+            return None, str(e), ""
+
         parsed = extract_json(raw)
         if parsed:
             dec = (parsed.get("decision") or "").upper()
             if dec not in ("APPROVE", "REJECT"):
                 parsed["decision"] = "REJECT"
+            # Stored serialized so no caller shares (and can mutate) the cached answer
+            _LLM_CACHE.set(key, (orjson.dumps(parsed), raw))
             return parsed, None, raw
-        return None, "LLM returned empty/non-JSON output", raw
-    except Exception as e:
-        return None, str(e), ""
+        if json_retried:
+            return None, "LLM returned empty/non-JSON output", raw
+        # One re-ask on the same model with a stricter instruction
+        json_retried = True
+        contents = prompt + _STRICT_JSON_SUFFIX
+
+
+def first_llm_answer(
+    prompt: str, models: List[str], temperature: float, max_tokens: int
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Try `models` in order until one returns usable JSON.
+
+    Returns ({"model", "parsed"} or None, raw text of the winning/last attempt).
+    A failure starts the next model immediately; with LLM_HEDGE_DELAY > 0 a slow
+    model also gets the next one raced against it. Losers are not interrupted
+    (blocking HTTP calls), their results are simply ignored.
+    """
+    if LLM_HEDGE_DELAY <= 0:
+        raw_text = None
+        for m in models:
+            parsed, _, raw = call_gemini(prompt, m, temperature, max_tokens)
+            if parsed:
+                return {"model": m, "parsed": parsed}, raw
+            raw_text = raw
+        return None, raw_text
+
+    queue = list(models)
+    pending: Dict[Future, str] = {}
+
+    def launch() -> None:
+        m = queue.pop(0)
+        pending[_LLM_POOL.submit(call_gemini, prompt, m, temperature, max_tokens)] = m
+
+    raw_text = None
+    launch()
+    while pending:
+        done, _ = wait(pending, timeout=LLM_HEDGE_DELAY if queue else None, return_when=FIRST_COMPLETED)
+        if not done:
+            launch()  # still waiting: hedge with the next model
+            continue
+        for fut in done:
+            m = pending.pop(fut)
+            parsed, _, raw = fut.result()
+            if parsed:
+                return {"model": m, "parsed": parsed}, raw
+            raw_text = raw
+            if queue:
+                launch()
+    return None, raw_text
 
 
 def _norm_dec(x: Optional[str]) -> str:
@@ -386,12 +589,20 @@ def _norm_dec(x: Optional[str]) -> str:
     return "APPROVE" if (x or "").upper() == "APPROVE" else "REJECT"
 
 
-def majority_vote(ballots: List[Dict[str, Any]]) -> Dict[str, Any]:
+class Ballot(NamedTuple):
+    """One evaluator's vote in the ensemble."""
+    source: str
+    decision: str
+    confidence: float
+    reasons: List[str]
+
+
+def majority_vote(ballots: List[Ballot]) -> Dict[str, Any]:
     """Determine final decision by majority vote (2 out of 3)."""
-    decs = [_norm_dec(b.get("decision")) for b in ballots]
-    cnt = Counter(decs)
-    final = "APPROVE" if cnt["APPROVE"] >= 2 else "REJECT"
-    return {"final": final, "tally": {"APPROVE": cnt["APPROVE"], "REJECT": cnt["REJECT"]}}
+    # _norm_dec maps anything but APPROVE to REJECT, so REJECT is simply the rest
+    approve = sum(_norm_dec(b.decision) == "APPROVE" for b in ballots)
+    final = "APPROVE" if approve >= 2 else "REJECT"
+    return {"final": final, "tally": {"APPROVE": approve, "REJECT": len(ballots) - approve}}
 
 
 def decide_ensemble(
@@ -399,7 +610,8 @@ def decide_ensemble(
     fico: Dict[str, Any],
     model: str = DEFAULT_MODEL,
     temperature: float = DEFAULT_TEMPERATURE,
-    max_tokens: int = DEFAULT_MAX_TOKENS
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    always_llm: bool = ALWAYS_LLM,
 ) -> Dict[str, Any]:
     """
     Main ensemble decision function combining rules, gate, and LLM evaluations.
@@ -410,6 +622,7 @@ def decide_ensemble(
         model: Gemini model to use
         temperature: LLM temperature
         max_tokens: Max output tokens for LLM
+        always_llm: Call the LLM even when rules and gate already agree
         
     Returns:
         Decision dict with final decision, confidence, reasons, and summary
@@ -422,56 +635,63 @@ def decide_ensemble(
     d = derive_metrics(profile, fico)
 
     # 1) Rules-based evaluation
-    rules_res = rules_decide(profile, fico, cfg)
-    rules_ballot = {
-        "source": "rules",
-        "decision": rules_res["decision"],
-        "confidence": rules_res["confidence"],
-        "reasons": rules_res["reasons"]
-    }
+    rules_res = rules_decide(profile, fico, cfg, d)
+    rules_ballot = Ballot(
+        source="rules",
+        decision=rules_res["decision"],
+        confidence=rules_res["confidence"],
+        reasons=rules_res["reasons"],
+    )
 
     # 2) Gate evaluation
-    gate_res = gate_decide(profile, fico, cfg)
-    gate_ballot = {
-        "source": "gate",
-        "decision": gate_res["decision"],
-        "confidence": gate_res["confidence"],
-        "reasons": gate_res["reasons"]
-    }
+    gate_res = gate_decide(profile, fico, cfg, d)
+    gate_ballot = Ballot(
+        source="gate",
+        decision=gate_res["decision"],
+        confidence=gate_res["confidence"],
+        reasons=gate_res["reasons"],
+    )
 
-    # 3) LLM evaluation with fallback
-    prompt = build_llm_prompt(profile, fico, d)
-    fallbacks = [m.strip() for m in (FALLBACK_MODELS_ENV or "").split(",") if m.strip()]
-    
+    # 3) LLM evaluation with fallback, only when its vote can decide the outcome
+    llm_skipped = not always_llm and rules_ballot.decision == gate_ballot.decision
     llm_ok, raw_text = None, None
-    for m in [model] + fallbacks:
-        parsed, err, raw = call_gemini(prompt, m, temperature, max_tokens)
-        if parsed:
-            llm_ok = {"model": m, "parsed": parsed}
-            raw_text = raw
-            break
-        raw_text = raw
-
-    if llm_ok:
+    if not llm_skipped:
+        prompt = build_llm_prompt(profile, fico, d)
+        fallbacks = [m.strip() for m in (FALLBACK_MODELS_ENV or "").split(",") if m.strip()]
+        llm_ok, raw_text = first_llm_answer(prompt, [model] + fallbacks, temperature, max_tokens)
+
+    if llm_skipped:
+        # Placeholder vote repeating the agreed decision, so the tally stays 3-0;
+        # its own source keeps it apart from a vote the LLM actually cast
+        llm_ballot = Ballot(
+            source="llm-skipped",
+            decision=rules_ballot.decision,
+            confidence=0.7,
+            reasons=[],
+        )
+        llm_model_used = None
+        llm_hint_factors = {}
+        llm_notes = ""
+    elif llm_ok:
         llm_decision = _norm_dec(llm_ok["parsed"].get("decision"))
         llm_conf = float(llm_ok["parsed"].get("confidence", 0.7) or 0.7)
         llm_reasons = llm_ok["parsed"].get("reasons", [])
         llm_notes = llm_ok["parsed"].get("notes", "")
-        llm_ballot = {
-            "source": "llm",
-            "decision": llm_decision,
-            "confidence": llm_conf,
-            "reasons": llm_reasons
-        }
+        llm_ballot = Ballot(
+            source="llm",
+            decision=llm_decision,
+            confidence=llm_conf,
+            reasons=llm_reasons,
+        )
         llm_model_used = llm_ok["model"]
         llm_hint_factors = llm_ok["parsed"].get("key_factors", {})
     else:
-        llm_ballot = {
-            "source": "llm",
-            "decision": "REJECT",
-            "confidence": 0.6,
-            "reasons": ["Saat ini sistem AI tidak memberikan respons yang dapat diandalkan, sehingga kami mengambil pendekatan konservatif."]
-        }
+        llm_ballot = Ballot(
+            source="llm",
+            decision="REJECT",
+            confidence=0.6,
+            reasons=["Saat ini sistem AI tidak memberikan respons yang dapat diandalkan, sehingga kami mengambil pendekatan konservatif."],
+        )
         llm_model_used = None
         llm_hint_factors = {}
         llm_notes = "—"
@@ -484,9 +704,9 @@ def decide_ensemble(
     # 5) Build human-readable output
     reasons = human_reasons(
         final_decision,
-        rules_ballot["reasons"],
-        gate_ballot["reasons"],
-        llm_ballot["reasons"]
+        rules_ballot.reasons,
+        gate_ballot.reasons,
+        llm_ballot.reasons
     )
     reasons += human_bullets_for_metrics(profile, fico, d, cfg.max_dti, cfg.max_ltv, cfg.min_score)
 
@@ -1,10 +1,16 @@
-from dataclasses import dataclass
-from typing import Optional, Tuple, Dict, Any, Union
+from bisect import bisect
+from dataclasses import dataclass, fields
+from itertools import accumulate
+from typing import Optional, Tuple, Dict, Any, Union, Sequence, Callable
+import functools
 import random
-import hashlib
+import zlib
+
+import numpy as np
 
 # ================== DOMAIN MODEL (Dataclass) ==================
-@dataclass
+# Frozen (immutable + hashable) so scoring results can be memoized per profile
+@dataclass(frozen=True, slots=True)
 class CreditProfile:
     # Payment history (35%)
     late_30: int = 0
@@ -33,11 +39,16 @@ class CreditProfile:
     has_revolving: bool = True
     has_student_or_auto: bool = False
 
-# ================== SCORING HELPERS ==================
 
-def clamp(x: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, x))
+# All fields are scalars, so a flat copy is enough (asdict() recurses and deep-copies)
+_PROFILE_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(CreditProfile))
+
 
+def profile_to_dict(p: CreditProfile) -> Dict[str, Any]:
+    return {k: getattr(p, k) for k in _PROFILE_FIELDS}
+
+
+# ================== SCORING HELPERS ==================
 
 def score_payment_history(p: CreditProfile) -> float:
     s = 100.0
@@ -49,8 +60,8 @@ def score_payment_history(p: CreditProfile) -> float:
     if p.has_bankruptcy:
         s -= 40.0
     if p.months_since_last_delinquency is not None:
-        s += clamp((p.months_since_last_delinquency / 24.0) * 10.0, 0, 10)
-    return clamp(s, 0, 100)
+        s += max(0, min(10, (p.months_since_last_delinquency / 24.0) * 10.0))
+    return max(0, min(100, s))
 
 
 def score_amounts_owed(p: CreditProfile) -> float:
@@ -68,40 +79,35 @@ def score_amounts_owed(p: CreditProfile) -> float:
         s -= 25.0
     else:
         s -= 45.0
-    s -= clamp(p.installment_balance_ratio * 20.0, 0, 20)
+    s -= max(0, min(20, p.installment_balance_ratio * 20.0))
     if p.total_accounts < 3:
         s -= 5.0
     elif p.total_accounts >= 15:
         s -= 3.0
-    return clamp(s, 0, 100)
+    return max(0, min(100, s))
 
 
 def score_length_history(p: CreditProfile) -> float:
-    s = 0.0
-    s += clamp((p.age_oldest_acct_years / 20.0) * 60.0, 0, 60)
-    s += clamp((p.avg_age_years / 10.0) * 40.0, 0, 40)
-    return clamp(s, 0, 100)
+    # Each term is clamped to its share (60 + 40), so the sum is already within 0..100
+    return (
+        max(0, min(60, (p.age_oldest_acct_years / 20.0) * 60.0))
+        + max(0, min(40, (p.avg_age_years / 10.0) * 40.0))
+    )
+
+
+# Adjustment for counts 0, 1, 2; anything else (3+, or a bogus negative) gets the fallback
+_HARD_INQ_DELTA = (3.0, -5.0, -10.0)
+_HARD_INQ_DEFAULT = -20.0
+_NEW_ACCT_DELTA = (2.0, -5.0, -10.0)
+_NEW_ACCT_DEFAULT = -18.0
 
 
 def score_new_credit(p: CreditProfile) -> float:
+    hi, na = p.hard_inquiries_12m, p.new_accounts_12m
     s = 100.0
-    if p.hard_inquiries_12m == 0:
-        s += 3.0
-    elif p.hard_inquiries_12m == 1:
-        s -= 5.0
-    elif p.hard_inquiries_12m == 2:
-        s -= 10.0
-    else:
-        s -= 20.0
-    if p.new_accounts_12m == 0:
-        s += 2.0
-    elif p.new_accounts_12m == 1:
-        s -= 5.0
-    elif p.new_accounts_12m == 2:
-        s -= 10.0
-    else:
-        s -= 18.0
-    return clamp(s, 0, 100)
+    s += _HARD_INQ_DELTA[hi] if 0 <= hi < 3 else _HARD_INQ_DEFAULT
+    s += _NEW_ACCT_DELTA[na] if 0 <= na < 3 else _NEW_ACCT_DEFAULT
+    return max(0, min(100, s))
 
 
 def score_mix(p: CreditProfile) -> float:
@@ -114,7 +120,7 @@ def score_mix(p: CreditProfile) -> float:
         s += 10.0
     if p.has_student_or_auto:
         s += 5.0
-    return clamp(s, 0, 100)
+    return s  # 50..95, no clamp needed
 
 
 WEIGHTS: Dict[str, float] = {
@@ -125,28 +131,164 @@ WEIGHTS: Dict[str, float] = {
     "credit_mix": 0.10,
 }
 
-
-def fico_like(p: CreditProfile) -> Tuple[float, Dict[str, float]]:
+# Positional copies for the hot path (WEIGHTS stays the public/API view)
+_W_PH, _W_AO, _W_LH, _W_NC, _W_CM = (
+    WEIGHTS["payment_history"],
+    WEIGHTS["amounts_owed"],
+    WEIGHTS["length_history"],
+    WEIGHTS["new_credit"],
+    WEIGHTS["credit_mix"],
+)
+
+
+# Order of the component tuple produced by the scorer (and of the breakdown dict)
+BREAKDOWN_KEYS: Tuple[str, ...] = (
+    "payment_history",
+    "amounts_owed",
+    "length_history",
+    "new_credit",
+    "credit_mix",
+    "weighted_index_0_100",
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def _fico_like_cached(p: CreditProfile) -> Tuple[float, Tuple[float, float, float, float, float, float]]:
     ph = score_payment_history(p)
     ao = score_amounts_owed(p)
     lh = score_length_history(p)
     nc = score_new_credit(p)
     cm = score_mix(p)
     weighted_0_100 = (
-        WEIGHTS["payment_history"] * ph
-        + WEIGHTS["amounts_owed"] * ao
-        + WEIGHTS["length_history"] * lh
-        + WEIGHTS["new_credit"] * nc
-        + WEIGHTS["credit_mix"] * cm
+        _W_PH * ph
+        + _W_AO * ao
+        + _W_LH * lh
+        + _W_NC * nc
+        + _W_CM * cm
     )
     score_300_850 = round(300 + (weighted_0_100 / 100.0) * (850 - 300), 0)
+    return score_300_850, (ph, ao, lh, nc, cm, round(weighted_0_100, 2))
+
+
+def fico_like(p: CreditProfile) -> Tuple[float, Dict[str, float]]:
+    # Scoring is deterministic per profile; only the breakdown dict is rebuilt
+    # per call so callers never share (and mutate) a cached object.
+    score_300_850, parts = _fico_like_cached(p)
+    return score_300_850, dict(zip(BREAKDOWN_KEYS, parts))
+
+
+# ================== BATCH SCORING (NumPy, struct-of-arrays) ==================
+@dataclass
+class CreditProfileBatch:
+    """Many profiles as one 1-D array per CreditProfile field (struct-of-arrays).
+
+    `months_since_last_delinquency` is float with NaN standing in for None.
+    """
+    late_30: np.ndarray
+    late_60: np.ndarray
+    late_90p: np.ndarray
+    has_collection: np.ndarray
+    has_bankruptcy: np.ndarray
+    months_since_last_delinquency: np.ndarray
+    revolving_utilization: np.ndarray
+    installment_balance_ratio: np.ndarray
+    total_accounts: np.ndarray
+    age_oldest_acct_years: np.ndarray
+    avg_age_years: np.ndarray
+    hard_inquiries_12m: np.ndarray
+    new_accounts_12m: np.ndarray
+    has_mortgage: np.ndarray
+    has_installment: np.ndarray
+    has_revolving: np.ndarray
+    has_student_or_auto: np.ndarray
+
+    @classmethod
+    def from_profiles(cls, profiles: Sequence[CreditProfile]) -> "CreditProfileBatch":
+        cols: Dict[str, np.ndarray] = {}
+        for f in _PROFILE_FIELDS:
+            values = [getattr(p, f) for p in profiles]
+            if f == "months_since_last_delinquency":
+                cols[f] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+            elif f in BOOL_FIELDS:
+                cols[f] = np.array(values, dtype=bool)
+            elif f in NUM_INT_FIELDS:
+                cols[f] = np.array(values, dtype=np.int64)
+            else:
+                cols[f] = np.array(values, dtype=np.float64)
+        return cls(**cols)
+
+
+# Same arithmetic, in the same order, as the scalar helpers above so batch and
+# single-profile scores agree exactly.
+def score_payment_history_batch(b: CreditProfileBatch) -> np.ndarray:
+    s = np.full(b.late_30.shape, 100.0)
+    s -= b.late_30 * 3.0
+    s -= b.late_60 * 7.0
+    s -= b.late_90p * 15.0
+    s -= np.where(b.has_collection, 20.0, 0.0)
+    s -= np.where(b.has_bankruptcy, 40.0, 0.0)
+    msld = b.months_since_last_delinquency
+    s += np.where(np.isnan(msld), 0.0, np.clip((msld / 24.0) * 10.0, 0, 10))
+    return np.clip(s, 0, 100)
+
+
+def score_amounts_owed_batch(b: CreditProfileBatch) -> np.ndarray:
+    util = b.revolving_utilization
+    s = 100.0 + np.select(
+        [util <= 0.01, util <= 0.09, util <= 0.29, util <= 0.49, util <= 0.74],
+        [-2.0, 5.0, 0.0, -10.0, -25.0],
+        default=-45.0,
+    )
+    s -= np.clip(b.installment_balance_ratio * 20.0, 0, 20)
+    s += np.select([b.total_accounts < 3, b.total_accounts >= 15], [-5.0, -3.0], default=0.0)
+    return np.clip(s, 0, 100)
+
+
+def score_length_history_batch(b: CreditProfileBatch) -> np.ndarray:
+    return (
+        np.clip((b.age_oldest_acct_years / 20.0) * 60.0, 0, 60)
+        + np.clip((b.avg_age_years / 10.0) * 40.0, 0, 40)
+    )
+
+
+def score_new_credit_batch(b: CreditProfileBatch) -> np.ndarray:
+    hi, na = b.hard_inquiries_12m, b.new_accounts_12m
+    s = 100.0 + np.select([hi == 0, hi == 1, hi == 2], _HARD_INQ_DELTA, default=_HARD_INQ_DEFAULT)
+    s += np.select([na == 0, na == 1, na == 2], _NEW_ACCT_DELTA, default=_NEW_ACCT_DEFAULT)
+    return np.clip(s, 0, 100)
+
+
+def score_mix_batch(b: CreditProfileBatch) -> np.ndarray:
+    s = np.full(b.has_revolving.shape, 50.0)
+    s += np.where(b.has_revolving, 15.0, 0.0)
+    s += np.where(b.has_installment, 15.0, 0.0)
+    s += np.where(b.has_mortgage, 10.0, 0.0)
+    s += np.where(b.has_student_or_auto, 5.0, 0.0)
+    return s
+
+
+_WEIGHTS_ARR = np.array([_W_PH, _W_AO, _W_LH, _W_NC, _W_CM])
+
+
+def fico_like_batch(b: CreditProfileBatch) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """Vectorized `fico_like`: (scores, breakdown columns) for every profile in the batch."""
+    ph = score_payment_history_batch(b)
+    ao = score_amounts_owed_batch(b)
+    lh = score_length_history_batch(b)
+    nc = score_new_credit_batch(b)
+    cm = score_mix_batch(b)
+    w = _WEIGHTS_ARR
+    weighted_0_100 = w[0] * ph + w[1] * ao + w[2] * lh + w[3] * nc + w[4] * cm
+    score_300_850 = np.round(300 + (weighted_0_100 / 100.0) * (850 - 300), 0)
     breakdown = {
         "payment_history": ph,
         "amounts_owed": ao,
         "length_history": lh,
         "new_credit": nc,
         "credit_mix": cm,
-        "weighted_index_0_100": round(weighted_0_100, 2),
+        # np.round(x, 2) scales by 100 first and can land on the other side of a
+        # tie (94.105 -> 94.1); Python's correctly-rounded round() matches fico_like.
+        "weighted_index_0_100": np.array([round(x, 2) for x in weighted_0_100.tolist()]),
     }
     return score_300_850, breakdown
 
@@ -177,35 +319,39 @@ BOOL_FIELDS = [
 ]
 
 
+def _to_bool(v: Any) -> bool:
+    if isinstance(v, bool):
+        return v
+    sv = str(v).lower()
+    if sv == "true":
+        return True
+    if sv == "false":
+        return False
+    raise ValueError(v)
+
+
+# field -> (coercer, error message); built once so parsing is a single pass over the payload
+_FIELD_COERCERS: Dict[str, Tuple[Callable[[Any], Any], str]] = {
+    **{f: (int, "must be integer") for f in NUM_INT_FIELDS},
+    **{f: (float, "must be float") for f in NUM_FLOAT_FIELDS},
+    **{f: (_to_bool, "must be boolean") for f in BOOL_FIELDS},
+}
+
+
 def parse_profile_partial(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
     errors: Dict[str, str] = {}
     data: Dict[str, Any] = {}
 
-    # ints
-    for f in NUM_INT_FIELDS:
-        if f in payload and payload[f] is not None:
-            try:
-                data[f] = int(payload[f])
-            except (TypeError, ValueError):
-                errors[f] = "must be integer"
-
-    # floats
-    for f in NUM_FLOAT_FIELDS:
-        if f in payload and payload[f] is not None:
-            try:
-                data[f] = float(payload[f])
-            except (TypeError, ValueError):
-                errors[f] = "must be float"
-
-    # bools
-    for f in BOOL_FIELDS:
-        if f in payload and payload[f] is not None:
-            if isinstance(payload[f], bool):
-                data[f] = payload[f]
-            elif str(payload[f]).lower() in ["true", "false"]:
-                data[f] = str(payload[f]).lower() == "true"
-            else:
-                errors[f] = "must be boolean"
+    # unknown keys and explicit nulls are ignored
+    for f, v in payload.items():
+        spec = _FIELD_COERCERS.get(f)
+        if spec is None or v is None:
+            continue
+        coerce, msg = spec
+        try:
+            data[f] = coerce(v)
+        except (TypeError, ValueError):
+            errors[f] = msg
 
     # range checks
     if "revolving_utilization" in data and not (0.0 <= data["revolving_utilization"] <= 1.0):
@@ -219,17 +365,39 @@ def parse_profile_partial(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict
 # ---- Dummy generator: deterministic per seed ----
 
 def make_dummy_profile(seed: Optional[Union[str, int]] = None) -> CreditProfile:
-    rng = random.Random()
-    if seed is not None:
-        # Convert seed to string to handle both str and int types
-        str_seed = str(seed)
-        h = int(hashlib.sha256(str_seed.encode("utf-8")).hexdigest(), 16) % (10**8)
-        rng.seed(h)
+    if seed is None:
+        return _generate_dummy_profile(random.Random())
+    # Convert seed to string to handle both str and int types
+    return _seeded_dummy_profile(str(seed))
+
+
+@functools.lru_cache(maxsize=4096)
+def _seeded_dummy_profile(str_seed: str) -> CreditProfile:
+    # Output depends only on the seed and CreditProfile is frozen → safe to share
+    # crc32 only mixes the seed for Random(); no need for a cryptographic hash.
+    # Note: profiles generated before this change came from a sha256-derived seed.
+    return _generate_dummy_profile(random.Random(zlib.crc32(str_seed.encode("utf-8"))))
 
+
+# Cumulative weights for the count fields; the drawn value is the bucket index (0, 1, 2, ...)
+_LATE_30_CUM = tuple(accumulate([0.80, 0.15, 0.05]))
+_LATE_60_CUM = tuple(accumulate([0.92, 0.08]))
+_LATE_90P_CUM = tuple(accumulate([0.97, 0.03]))
+_HARD_INQ_CUM = tuple(accumulate([0.55, 0.25, 0.12, 0.06, 0.02]))
+_NEW_ACCT_CUM = tuple(accumulate([0.60, 0.25, 0.12, 0.03]))
+
+
+def _weighted_count(rng: random.Random, cum: Tuple[float, ...]) -> int:
+    # Same draw as rng.choices(range(len(cum)), cum_weights=cum)[0], minus the
+    # per-call list building, so seeded profiles are unchanged.
+    return bisect(cum, rng.random() * cum[-1], 0, len(cum) - 1)
+
+
+def _generate_dummy_profile(rng: random.Random) -> CreditProfile:
     # Payment history
-    late_30 = rng.choices([0, 1, 2], weights=[0.80, 0.15, 0.05])[0]
-    late_60 = rng.choices([0, 1], weights=[0.92, 0.08])[0]
-    late_90p = rng.choices([0, 1], weights=[0.97, 0.03])[0]
+    late_30 = _weighted_count(rng, _LATE_30_CUM)
+    late_60 = _weighted_count(rng, _LATE_60_CUM)
+    late_90p = _weighted_count(rng, _LATE_90P_CUM)
     has_collection = rng.random() < 0.06
     has_bankruptcy = rng.random() < 0.01
     months_since_last_delinquency: Optional[int] = None
@@ -246,13 +414,12 @@ def make_dummy_profile(seed: Optional[Union[str, int]] = None) -> CreditProfile:
     # Accounts & ages
     total_accounts = rng.randint(3, 18)
     age_oldest_acct_years = round(rng.uniform(2, 20), 1)
-    avg_age_years = round(
-        max(0.5, min(age_oldest_acct_years - rng.uniform(0.5, 6.0), age_oldest_acct_years)), 1
-    )
+    # uniform(0.5, 6.0) > 0, so the average is always below the oldest account; only the floor applies
+    avg_age_years = round(max(0.5, age_oldest_acct_years - rng.uniform(0.5, 6.0)), 1)
 
     # New credit
-    hard_inquiries_12m = rng.choices([0, 1, 2, 3, 4], weights=[0.55, 0.25, 0.12, 0.06, 0.02])[0]
-    new_accounts_12m = rng.choices([0, 1, 2, 3], weights=[0.60, 0.25, 0.12, 0.03])[0]
+    hard_inquiries_12m = _weighted_count(rng, _HARD_INQ_CUM)
+    new_accounts_12m = _weighted_count(rng, _NEW_ACCT_CUM)
 
     # Mix
     has_revolving = True